@@ -5,6 +5,7 @@ It utilizes the tkinter library for creating the GUI elements and interacts with
 Spellcast WordBoard class to generate words based on user input.
 
 Classes:
+    LabelHover: Highlights a generated word on the board while its label is hovered.
     SpellcastApp: Represents the main application class for the Spellcast Word Finder.
 
 Functions:
@@ -15,7 +16,7 @@ Usage:
 
 Example:
     import tkinter as tk
-    from spellcast_app import SpellcastApp
+    from gui import SpellcastApp
 
     if __name__ == "__main__":
         root = tk.Tk()
@@ -27,18 +28,132 @@ import tkinter as tk
 import tkinter.font as tkFont
 from spellcast import WordBoard
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+WORD_LABEL_PREFIX = ("No swaps", "One swap", "Two swaps")
+
+class LabelHover:
+    """
+    A class representing the hover effect for labels.
+
+    Board state (canvas items, cell styles and the cell letters) is read
+    through the owning app, so an instance only holds the word it shows.
+
+    Attributes:
+        app (SpellcastApp): The application whose board is highlighted.
+        label (tk.Label): The label to apply the hover effect to.
+        path (list): The flat indices of the cells in the word's path.
+        skipped (list): The flat indices of the skipped cells in the word.
+        word (str): The word associated with the label.
+
+    Methods:
+        hover(self): Applies the hover effect to the label.
+        unhover(self): Removes the hover effect from the label.
+        detach(self): Unbinds the hover handlers from the label.
+    """
+
+    # cell style codes and their rectangle styles, shared by every instance
+    RESET, FIRST, LAST, PATH, SKIPPED = range(5)
+    RECT_STYLES = (
+        {"outline": "black", "fill": "white"},
+        {"outline": "#F522EE", "fill": "#43C6E2"},
+        {"outline": "purple", "fill": "#43C6E2"},
+        {"outline": "#43C6E2", "fill": "#43C6E2"},
+        {"outline": "red", "fill": "red"},
+    )
+
+    def __init__(self, app, label, path, skipped, word):
+        """
+        Initializes the LabelHover object.
+
+        Args:
+            app (SpellcastApp): The application whose board is highlighted.
+            label (tk.Label): The label to apply the hover effect to.
+            path (list): The flat indices of the cells in the word's path.
+            skipped (list): The flat indices of the skipped cells in the word.
+            word (str): The word associated with the label.
+        """
+        self.app = app
+        self.label = label
+        self.path = path
+        self.skipped = skipped
+        # hover state is built on the first hover; most results are never hovered
+        self._path_rev = None
+        self.skip_mask = 0
+        self._enter_id = self.label.bind("<Enter>", lambda _: self.hover())
+        self._leave_id = self.label.bind("<Leave>", lambda _: self.unhover())
+        self.word = word
+
+    def _prepare(self):
+        """
+        Builds the lookup state used by hover.
+        """
+        # the path is stored last letter first; hover walks it in word order
+        self._path_rev = self.path[::-1]
+        for index in self.skipped:
+            self.skip_mask |= 1 << index
+
+    def hover(self):
+        """
+        Applies the hover effect to the label.
+        """
+        if self._path_rev is None:
+            self._prepare()
+        values = self.app.values
+        styles = {}
+        for index, c in zip(self._path_rev, self.word):
+            # skipped cells show the letter they are swapped to
+            if self.skip_mask & (1 << index):
+                styles[index] = (self.SKIPPED, c)
+            # if first letter of word, highlight in pinkpurple
+            elif index == self.path[-1]:
+                styles[index] = (self.FIRST, values[index])
+            elif index == self.path[0]:
+                styles[index] = (self.LAST, values[index])
+            else:
+                styles[index] = (self.PATH, values[index])
+        self.app.set_cell_styles(styles)
+
+    def unhover(self):
+        """
+        Removes the hover effect from the label.
+        """
+        if self._path_rev is None:
+            return
+        # the cells go back to the letters the app holds now, which may have been
+        # edited since the search
+        values = self.app.values
+        self.app.set_cell_styles({index: (self.RESET, values[index]) for index in self.path})
+
+    def detach(self):
+        """
+        Unbinds the hover handlers, releasing their Tcl commands.
+
+        The cells are reset first, as the <Leave> that would have done it may
+        never come if the label is hovered while new results arrive.
+        """
+        self.unhover()
+        self.label.unbind("<Enter>", self._enter_id)
+        self.label.unbind("<Leave>", self._leave_id)
+
 
 class SpellcastApp:
     """
     A class representing the Spellcast Word Finder application.
 
+    The board is drawn on a single canvas: every cell is a rectangle item plus a
+    text item, and one shared entry field is placed over the cell being edited.
+
     Attributes:
         word_board (WordBoard): An instance of the WordBoard class.
 
     Methods:
         __init__(self, app_window): Initializes the SpellcastApp object.
-        on_validate(new_value, row, column): Validates the input in the entry fields.
+        on_validate(new_value): Validates the input in the cell editor.
+        focus_cell(self, index): Moves the cell editor to a specific cell.
         generate_words_command(self): Generates words based on the input values.
+        poll_results(self, future): Shows the generated words.
+        set_cell_styles(self, styles): Requests new styles for board cells.
         add_multiplier(self, row, col, word=False): Adds a multiplier to a specific cell.
         remove_multiplier(self, row, col): Removes a multiplier from a specific cell.
     """
@@ -50,8 +165,15 @@ class SpellcastApp:
         Args:
             app_window (tk.Tk): The main application window.
         """
-        self.word_board = WordBoard()
+        # built by _warmup on the worker thread, before any search it runs
+        self.word_board = None
+        self._warmup_future = None
         self.app_window = app_window
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        # results of the last search, reused while the board is unchanged
+        self._last_key = None
+        self._last_future = None
+        self._hovers = []
 
         app_window.title("Spellcast Word Finder")
         width = 600
@@ -67,22 +189,39 @@ class SpellcastApp:
         app_window.geometry(window_position)
         app_window.resizable(width=False, height=False)
 
-        self.values = [
-            [tk.StringVar(app_window, value="") for _ in range(5)] for _ in range(5)
-        ]
-        self.line_inputs = []
+        # board state is stored flat, indexed by row * 5 + column
+        self.values = [""] * 25
+        self.cell_rects = []
+        self.cell_texts = []
+        self.focused = 0
+        self._pending_advance = None
         self.labels = []
-        self.btn_generate = tk.Button(app_window)
-        self.btn_clear = tk.Button(app_window)
+        # fonts are shared by every widget and canvas item that uses them
+        self._font_small = tkFont.Font(family="Times", size=10)
+        self._font_cell = tkFont.Font(family="Roboto", size=16)
+        self._font_cell_bold = tkFont.Font(family="Roboto", size=20, weight="bold")
+        # canvas text styles, indexed by the LabelHover style codes; every style
+        # sets the same options, so applying one never depends on the last
+        text_bold = {"font": self._font_cell_bold, "fill": "#333333"}
+        text_highlight = {"font": self._font_cell_bold, "fill": "white"}
+        self.text_styles = (
+            {"font": self._font_cell, "fill": "#333333"},
+            text_bold,
+            text_bold,
+            text_highlight,
+            text_highlight,
+        )
+        # applied and requested (style code, letter) of every cell
+        self._cell_style = [(LabelHover.RESET, "")] * 25
+        self._cell_target = {}
+        self._pending_styles = None
 
-        def on_validate(new_value, row, column):
+        def on_validate(new_value):
             """
-            Validates the input in the entry fields.
+            Validates the input in the cell editor.
 
             Args:
-                new_value (str): The new value entered in the entry field.
-                row (int): The row index of the entry field.
-                column (int): The column index of the entry field.
+                new_value (str): The new value entered in the cell editor.
 
             Returns:
                 bool: True if the input is valid, False otherwise.
@@ -90,202 +229,268 @@ class SpellcastApp:
             # new_value only alphabet characters
             if not new_value.isalpha() and new_value != "":
                 return False
-            
-            row, column = map(int, (row, column))
-            index = (row * 5 + column + 1) % 25
-            if len(new_value) == 1:
-                self.line_inputs[index].focus_set()
-                self.line_inputs[index].select_range(0, "end")
+
+            if new_value != self.values[self.focused]:
+                self.values[self.focused] = new_value
+                self.canvas.itemconfig(self.cell_texts[self.focused], text=new_value)
+                self._cell_style[self.focused] = (self._cell_style[self.focused][0], new_value)
+            if len(new_value) == 1 and self._pending_advance is None:
+                # the editor can't be rewritten from inside its own validatecommand,
+                # and rapid keystrokes share one pending move
+                self._pending_advance = app_window.after_idle(
+                    self._advance_focus, (self.focused + 1) % 25
+                )
             return True
 
         x_offset, y_offset = 25, 25
+        cell_size = 32
+        self.canvas = tk.Canvas(
+            app_window,
+            width=5 * cell_size,
+            height=5 * cell_size,
+            highlightthickness=0,
+        )
+        self.canvas.place(x=x_offset, y=y_offset)
+        # every option is passed at creation time, one Tcl call per item
+        rect_opts = dict(outline="black", width=2, fill="white")
+        text_opts = dict(text="", font=self._font_cell, fill="#333333")
         for row in range(5):
             for column in range(5):
-                entry = tk.Entry(
-                    app_window,
-                    textvariable=self.values[row][column],
-                    validate="key",
-                    highlightthickness=2,
-                )
-                entry["borderwidth"] = "1px"
-                entry["font"] = tkFont.Font(family="Times", size=10)
-                entry["fg"] = "#333333"
-                entry["justify"] = "center"
-                entry["validatecommand"] = (
-                    entry.register(on_validate),
-                    "%P",
-                    row,
-                    column,
-                )
-                entry.place(
-                    x=x_offset + column * 32, y=y_offset + row * 32, width=32, height=32
+                x, y = column * cell_size, row * cell_size
+                self.cell_rects.append(
+                    self.canvas.create_rectangle(
+                        x + 1, y + 1, x + cell_size - 1, y + cell_size - 1, **rect_opts
+                    )
                 )
-                entry.configure(
-                    highlightbackground="black",
-                    highlightcolor="black",
-                    font=("Roboto", 16),
+                self.cell_texts.append(
+                    self.canvas.create_text(
+                        x + cell_size / 2,
+                        y + cell_size / 2,
+                        tags=(f"c{row}{column}",),
+                        **text_opts,
+                    )
                 )
-                def navigateEntry(idx):
-                    self.line_inputs[idx].focus_set()
-                    self.line_inputs[idx].select_range(0, "end")
-
-                # when the user presses arrow keys, the focus is moved to the next entry
-                entry.bind("<Left>", lambda _, row=row, column=column: navigateEntry((row * 5 + column - 1) % 25))
-                entry.bind("<Right>", lambda _, row=row, column=column: navigateEntry((row * 5 + column + 1) % 25))
-                entry.bind("<Up>", lambda _, row=row, column=column: navigateEntry(((row - 1) * 5 + column) % 25))
-                entry.bind("<Down>", lambda _, row=row, column=column: navigateEntry(((row + 1) * 5 + column) % 25))
-                self.line_inputs.append(entry)
+        self.canvas.bind(
+            "<Button-1>",
+            lambda event: self.focus_cell(
+                (event.y // cell_size) * 5 + event.x // cell_size
+            ),
+        )
 
+        self.editor = tk.Entry(
+            app_window,
+            validate="key",
+            highlightthickness=2,
+            highlightbackground="black",
+            highlightcolor="black",
+            borderwidth=1,
+            font=self._font_cell,
+            fg="#333333",
+            justify="center",
+        )
+        self.editor["validatecommand"] = (self.editor.register(on_validate), "%P")
+        # when the user presses arrow keys, the editor is moved to the next cell
+        self.editor.bind("<Left>", lambda _: self.focus_cell((self.focused - 1) % 25))
+        self.editor.bind("<Right>", lambda _: self.focus_cell((self.focused + 1) % 25))
+        self.editor.bind("<Up>", lambda _: self.focus_cell((self.focused - 5) % 25))
+        self.editor.bind("<Down>", lambda _: self.focus_cell((self.focused + 5) % 25))
+        self.focus_cell(0)
+
+        label_opts = dict(font=self._font_small, fg="#333333", justify="center", text="")
         for row in range(3):
-            label = tk.Label(app_window)
-            label["font"] = tkFont.Font(family="Times", size=10)
-            label["fg"] = "#333333"
-            label["justify"] = "center"
-            label["text"] = ""
+            label = tk.Label(app_window, **label_opts)
             label.place(x=320, y=80 + row * 30, width=250, height=25)
             self.labels.append(label)
 
-        self.btn_generate["bg"] = "#e9e9ed"
-        self.btn_generate["font"] = tkFont.Font(family="Times", size=10)
-        self.btn_generate["fg"] = "#000000"
-        self.btn_generate["justify"] = "center"
-        self.btn_generate["text"] = "Generate Words"
+        button_opts = dict(bg="#e9e9ed", font=self._font_small, fg="#000000", justify="center")
+        self.btn_generate = tk.Button(
+            app_window,
+            text="Generate Words",
+            command=self.generate_words_command,
+            **button_opts,
+        )
         self.btn_generate.place(x=x_offset, y=y_offset + 160, width=160, height=25)
-        self.btn_generate["command"] = lambda: threading.Thread(target=self.generate_words_command).start()
-        self.btn_clear["bg"] = "#e9e9ed"
-        self.btn_clear["font"] = tkFont.Font(family="Times", size=10)
-        self.btn_clear["fg"] = "#000000"
-        self.btn_clear["justify"] = "center"
-        self.btn_clear["text"] = "Reset Window"
+        self.btn_clear = tk.Button(
+            app_window,
+            text="Reset Window",
+            command=lambda: threading.Thread(target=self.clear_text()).start(),
+            **button_opts,
+        )
         self.btn_clear.place(x=x_offset + 170, y=y_offset + 160, width=160, height=25)
-        self.btn_clear["command"] = lambda: threading.Thread(target=self.clear_text()).start()
 
-    class LabelHover:
+        app_window.after(0, self._start_warmup)
+
+    def _start_warmup(self):
+        """
+        Queues _warmup on the worker thread and watches it for errors.
         """
-        A class representing the hover effect for labels.
+        self._warmup_future = self._pool.submit(self._warmup)
+        self._poll_warmup()
 
-        Attributes:
-            label (tk.Label): The label to apply the hover effect to.
-            path (str): The path of the word.
-            skipped (list): The list of skipped cells in the word.
-            line_inputs (list): The list of entry fields.
-            values (list): The list of StringVars representing the values in the entry fields.
-            word (str): The word associated with the label.
+    def _poll_warmup(self):
+        """
+        Shows the error in the result labels if _warmup failed.
+        """
+        if not self._warmup_future.done():
+            self.app_window.after(100, self._poll_warmup)
+            return
+        error = self._warmup_future.exception()
+        if error is not None:
+            self._show_error(error)
+
+    def _warmup(self):
+        """
+        Loads the word list and runs a first search on the worker thread.
 
-        Methods:
-            hover(self): Applies the hover effect to the label.
-            unhover(self): Removes the hover effect from the label.
+        Work queued later on the same single-worker pool always sees the
+        finished WordBoard, so the first real search pays no start-up cost.
         """
+        self.word_board = WordBoard()
+        self.word_board.set_board([["a"] * 5 for _ in range(5)])
+        self.word_board.best_word(0)
 
-        def __init__(self, label, path, skipped, line_inputs, values, word):
-            """
-            Initializes the LabelHover object.
+    def _advance_focus(self, index):
+        """
+        Moves the cell editor to the next cell once the typed letter is accepted.
 
-            Args:
-                label (tk.Label): The label to apply the hover effect to.
-                path (str): The path of the word.
-                skipped (list): The list of skipped cells in the word.
-                line_inputs (list): The list of entry fields.
-                values (list): The list of StringVars representing the values in the entry fields.
-                word (str): The word associated with the label.
-            """
-            self.label = label
-            self.path = path
-            self.skipped = skipped
-            self.skip_set = set(skipped)
-            self.line_inputs = line_inputs
-            self.label.bind("<Enter>", lambda _: self.hover())
-            self.label.bind("<Leave>", lambda _: self.unhover())
-            self.values = values
-            self.temporary = [
-                [value.get().lower() for value in line] for line in self.values
-            ]
-            self.word = word
-
-        def hover(self):
-            """
-            Applies the hover effect to the label.
-            """
-            for (i, j), c in zip(self.path[::-1], self.word):
-                entry_index = i * 5 + j
-                # if first letter of word, highlight in pinkpurple
-                if (i, j) == self.path[-1]:
-                    self.line_inputs[entry_index].configure(
-                        highlightbackground="#F522EE",
-                        highlightcolor="#F522EE",
-                        background="#43C6E2",
-                        font=("Roboto", 20, tkFont.BOLD),
-                    )
-                elif (i, j) == self.path[0]:
-                    self.line_inputs[entry_index].configure(
-                        highlightbackground="purple",
-                        highlightcolor="purple",
-                        background="#43C6E2",
-                        font=("Roboto", 20, tkFont.BOLD),
-                    )
-                else:
-                    self.line_inputs[entry_index].configure(
-                        highlightbackground="#43C6E2",
-                        highlightcolor="#43C6E2",
-                        background="#43C6E2",
-                        font=("Roboto", 20, tkFont.BOLD),
-                        fg="white",
-                    )
-               
-                if (i, j) in self.skip_set:
-                    self.values[i][j].set(c)
-
-            for i, j in self.skipped:
-                entry_index = i * 5 + j
-                self.line_inputs[entry_index].configure(
-                    highlightbackground="red",
-                    highlightcolor="red",
-                    background="red",
-                    font=("Roboto", 20, tkFont.BOLD),
-                    fg="white",
-                )
+        Args:
+            index (int): The flat index (row * 5 + column) of the next cell.
+        """
+        self._pending_advance = None
+        self.focus_cell(index)
 
-        def unhover(self):
-            """
-            Removes the hover effect from the label.
-            """
-            for i, j in self.path + self.skipped:
-                entry_index = i * 5 + j
-                self.line_inputs[entry_index].configure(
-                    highlightbackground="black",
-                    highlightcolor="black",
-                    background="white",
-                    font=("Roboto", 16, tkFont.NORMAL),
-                    fg="black",
-                )
-                self.values[i][j].set(self.temporary[i][j])
+    def _apply_labels(self, texts):
+        """
+        Sets the text of the three result labels back to back.
+
+        Args:
+            texts (list): The new label texts, one per swap count.
+        """
+        for label, text in zip(self.labels, texts):
+            label.config(text=text)
+
+    def _show_error(self, error):
+        """
+        Shows a failed start-up or search in the result labels.
+
+        Args:
+            error (Exception): The exception the worker raised.
+        """
+        self._apply_labels([f"{prefix}: Error: {error}" for prefix in WORD_LABEL_PREFIX])
+        self.btn_generate['state'] = 'normal'
+        self.btn_generate["text"] = "Generate Words"
+
+    def set_cell_styles(self, styles):
+        """
+        Requests new styles for board cells, applied on the next idle turn.
+
+        Requests made before the board is redrawn are merged, so a cell that
+        ends up in the style it already has is not touched at all. A style sets
+        every option of the cell, so only the last request for it matters.
+
+        Args:
+            styles (dict): Maps flat cell indices to (style code, letter) pairs.
+        """
+        self._cell_target.update(styles)
+        if self._pending_styles is None:
+            self._pending_styles = self.app_window.after_idle(self._apply_cell_styles)
+
+    def _apply_cell_styles(self):
+        """
+        Applies the requested cell styles, skipping cells already in that style.
+        """
+        self._pending_styles = None
+        for index, style in self._cell_target.items():
+            if self._cell_style[index] == style:
+                continue
+            code, letter = style
+            self.canvas.itemconfig(self.cell_rects[index], **LabelHover.RECT_STYLES[code])
+            self.canvas.itemconfig(self.cell_texts[index], text=letter, **self.text_styles[code])
+            self._cell_style[index] = style
+        self._cell_target = {}
+
+    def focus_cell(self, index):
+        """
+        Moves the cell editor over a specific cell.
+
+        Args:
+            index (int): The flat index (row * 5 + column) of the cell.
+        """
+        self.focused = index
+        row, column = divmod(index, 5)
+        # rewriting the editor must not go through on_validate
+        self.editor["validate"] = "none"
+        self.editor.delete(0, "end")
+        self.editor.insert(0, self.values[index])
+        self.editor["validate"] = "key"
+        self.editor.place(in_=self.canvas, x=column * 32, y=row * 32, width=32, height=32)
+        self.editor.focus_set()
+        self.editor.select_range(0, "end")
 
     def generate_words_command(self):
         """
         Generates words based on the input values.
+
+        The search runs on the worker pool; the labels are filled in by
+        poll_results once the result is ready.
         """
-        word_label_prefix = ["No swaps", "One swap", "Two swaps"]
-        for i in range(3):
-            self.labels[i]["text"] = f"{word_label_prefix[i]}: Generating..."
+        self._apply_labels([f"{prefix}: Generating..." for prefix in WORD_LABEL_PREFIX])
 
         self.btn_generate["text"] = "Generating..."
         self.btn_generate['state'] = 'disabled'
-        for line_input in self.line_inputs:
-            line_input['state'] = 'disabled'
-
-        board = [[v.get().lower() for v in line] for line in self.values]
-
-        for line_input in self.line_inputs:
-            line_input['state'] = 'normal'
+        # uncover the whole board so hovered words are fully visible
+        self.editor.place_forget()
+
+        # one snapshot feeds the search and the result cache key
+        board_snapshot = [v.lower() for v in self.values]
+        board = [board_snapshot[row * 5 : row * 5 + 5] for row in range(5)]
+
+        key = "".join(c or "." for c in board_snapshot)
+        if key != self._last_key:
+            # WordBoard keeps search state on itself, so the single worker runs
+            # these one after another
+            # self.word_board is resolved on the worker, after _warmup has run
+            self._pool.submit(lambda: self.word_board.set_board(board))
+            # one search finds the best word for every swap count
+            self._last_future = self._pool.submit(
+                lambda: self.word_board.best_words(len(WORD_LABEL_PREFIX) - 1)
+            )
+            self._last_key = key
+        self.poll_results(self._last_future)
 
-        self.word_board.set_board(board)
+    def poll_results(self, future):
+        """
+        Shows the generated words once the search has finished.
 
-        for i in range(3):
-            best = self.word_board.best_word(i)
-            self.labels[i]["text"] = f"{word_label_prefix[i]}: {best[:2]}"
-            self.LabelHover(
-                self.labels[i], best[2], best[3], self.line_inputs, self.values, best[0]
-            )
+        Args:
+            future (Future): The pending best_words result, one word per swap count.
+        """
+        if not future.done():
+            self.app_window.after(50, self.poll_results, future)
+            return
+
+        for hover in self._hovers:
+            hover.detach()
+        self._hovers = []
+
+        error = future.exception()
+        if error is not None:
+            # without a WordBoard every search fails, so report why there is none
+            if self.word_board is None and self._warmup_future is not None:
+                error = self._warmup_future.exception() or error
+            # a failed search is not reused, so the next Generate runs it again
+            self._last_key = None
+            self._show_error(error)
+            return
+
+        words = future.result()
+        texts = [f"{WORD_LABEL_PREFIX[i]}: {best[:2]}" for i, best in enumerate(words)]
+        self.app_window.after_idle(self._apply_labels, texts)
+        for i, best in enumerate(words):
+            path_flat = [row * 5 + column for row, column in best[2]]
+            skipped_flat = [row * 5 + column for row, column in best[3]]
+            hover = LabelHover(self, self.labels[i], path_flat, skipped_flat, best[0])
+            self._hovers.append(hover)
 
         self.btn_generate['state'] = 'normal'
         self.btn_generate["text"] = "Generate Words"
@@ -305,7 +510,8 @@ class SpellcastApp:
             col (int): The column index of the cell.
             word (bool): Whether the multiplier is for a word or a letter. Default is False.
         """
-        self.word_board.add_multiplier(row, col, 1, word)
+        self._last_key = None
+        self._pool.submit(lambda: self.word_board.add_multiplier(row, col, 1, word))
 
     def remove_multiplier(self, row, col):
         """
@@ -315,7 +521,8 @@ class SpellcastApp:
             row (int): The row index of the cell.
             col (int): The column index of the cell.
         """
-        self.word_board.remove_multiplier(row, col)
+        self._last_key = None
+        self._pool.submit(lambda: self.word_board.remove_multiplier(row, col))
 
 
 if __name__ == "__main__":
@@ -10,8 +10,10 @@ Attributes:
     - `board_value` (dict): A dictionary containing values for each cell on the board.
 
 Methods:
-    - `__init__()`: Initializes a `WordBoard` instance by reading words from a file
-    and initializing various attributes needed for managing the game board.
+    - `load_dictionary(path="words.txt")`: Reads the word list and builds its DAWG
+    once, caching the result for every `WordBoard`.
+    - `__init__()`: Initializes a `WordBoard` instance from the shared word list
+    and initializes various attributes needed for managing the game board.
     - `recalculate()`: Recalculates letter values and board values based on the 
     current state of the board.
     - `set_board(board)`: Sets the game board and recalculates attributes based
@@ -20,24 +22,32 @@ Methods:
     by checking if the required letters for the word are available on the board.
     - `board_contains(word, skips=0)`: Checks if the board contains
     a given word, considering skips and multipliers.
-    - `best_word(skips=0)`: Finds the highest scoring word that can be
+    - `best_word(skips=0, start_cells=None)`: Finds the highest scoring word that can be
     formed on the board, considering skips and multipliers.
+    - `best_words(skips=0, start_cells=None)`: Finds the best word for every skip
+    count up to `skips` with a single DAWG-guided search over the board.
     - `add_multiplier(row, column, multiplier, word)`: Adds a multiplier
     to a specific cell on the board and updates multipliers.
     - `remove_multiplier(row, column)`: Removes multipliers from a specific
     cell on the board and recalculates attributes.
+    - `solve_board(board, skips, start_cells=None)`: Runs `best_words` on a board
+    with a `WordBoard` kept per process, for use from worker processes.
 
 Usage:
     - Create an instance of the `WordBoard` class.
     - Set the game board using the `set_board()` method.
-    - Find the best words that can be formed on the board using the `best_word()` method.
+    - Find the best words that can be formed on the board using the `best_word()` method,
+    or `best_words()` for every skip count at once.
     - Add or remove multipliers using the `add_multiplier()` and `remove_multiplier()` methods.
 """
 
-from collections import Counter, defaultdict
-from functools import reduce
-from itertools import product
-import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from operator import add, itemgetter
+import os
 
 LETTERS_AND_VALUES = {
     "a": 1,
@@ -68,6 +78,216 @@ LETTERS_AND_VALUES = {
     "z": 8,
 }
 
+# LETTERS_AND_VALUES indexed by letter code (0 for "a" to 25 for "z")
+LETTER_VALUES = tuple(LETTERS_AND_VALUES[chr(ord("a") + code)] for code in range(26))
+
+LONG_WORD_BONUS_POINTS = 10
+LONG_WORD_MINIMUM_LETTER_COUNT = 6
+
+# a path visits every cell at most once, so no longer word fits on a 5x5 board
+MAXIMUM_WORD_LENGTH = 25
+
+# multipliers are stored one byte per cell, so none can be bigger than this
+MAXIMUM_MULTIPLIER = 255
+
+# how many word rankings (one per multiplier layout) a board keeps around
+RANKING_CACHE_SIZE = 8
+
+# the most worker processes the command line search starts
+MAXIMUM_WORKERS = 4
+
+# (row, column) steps to the 8 adjacent cells, in the order paths are tried
+NEIGHBOR_OFFSETS = ((1, 0), (1, 1), (1, -1), (-1, 0), (-1, 1), (-1, -1), (0, 1), (0, -1))
+
+
+def letter_code(character):
+    """
+    Convert a board or word character to its letter code.
+
+    Args:
+        character (str): A single lowercase letter, or anything else for an empty cell.
+
+    Returns:
+        int: 0 for "a" to 25 for "z", or 26 if the character is not a letter.
+    """
+    if character in LETTERS_AND_VALUES:
+        return ord(character) - ord("a")
+    return 26
+
+
+# letter code of every byte value, for translating ASCII text in one call
+LETTER_CODES = bytes(letter_code(chr(byte)) for byte in range(256))
+# and back: the ASCII letter of every letter code
+CODE_LETTERS = bytes(range(ord("a"), ord("z") + 1)) + bytes(230)
+
+# A letter histogram packs the count of every letter code into one int, one
+# 8-bit lane per code: seven bits of count below a guard bit (see histogram_fits)
+HISTOGRAM_LANE_BITS = 8
+HISTOGRAM_UNITS = tuple(1 << (HISTOGRAM_LANE_BITS * code) for code in range(27))
+HISTOGRAM_GUARDS = sum(unit << (HISTOGRAM_LANE_BITS - 1) for unit in HISTOGRAM_UNITS)
+
+
+def letter_histogram(codes):
+    """
+    Pack the letter counts of a sequence of letter codes into one int.
+
+    Args:
+        codes (bytes): Letter codes as returned by letter_code.
+
+    Returns:
+        int: The packed histogram; each count must stay below 128.
+    """
+    return sum(map(HISTOGRAM_UNITS.__getitem__, codes))
+
+
+def histogram_fits(needed, available):
+    """
+    Check that every letter count of one packed histogram fits in another.
+
+    Setting the guard bits of `available` and subtracting `needed` clears the
+    guard bit of exactly those lanes where more letters are needed than are
+    available, without borrowing across lanes, so all 27 counts are compared
+    in a single big-int subtraction.
+
+    Args:
+        needed (int): The packed histogram of the letters required.
+        available (int): The packed histogram of the letters at hand.
+
+    Returns:
+        bool: True if no letter is needed more often than it is available.
+    """
+    guards = HISTOGRAM_GUARDS
+    return ((available | guards) - needed) & guards == guards
+
+
+# the word list and everything derived from it, see load_dictionary
+Dictionary = namedtuple(
+    "Dictionary",
+    "words_set words word_codes word_histograms word_bonuses children terminal suffix_values root"
+    " child_table edges",
+)
+
+
+@lru_cache(maxsize=None)
+def load_dictionary(path="words.txt"):
+    """
+    Load a word list and build the lookup structures every WordBoard shares.
+
+    The result is cached, so the file is read and the DAWG is built only once
+    per path; callers must treat the returned structures as read-only.
+
+    Args:
+        path (str, optional): The word list, one word per line. Default is "words.txt".
+
+    Returns:
+        Dictionary: The word set, the words in descending order with their letter
+        codes, histograms and long word bonuses, and the DAWG (children, terminal,
+        suffix_values and root, plus the flat child_table and edges) of the words.
+    """
+    with open(path, encoding="utf-8") as file:
+        # only words of letters a-z that are short enough to fit on the board are kept
+        words_set = {
+            word
+            for word in file.read().splitlines()
+            if 0 < len(word) <= MAXIMUM_WORD_LENGTH and set(word) <= LETTERS_AND_VALUES.keys()
+        }
+    words = sorted(words_set, reverse=True)
+    # letters as codes 0-25 (see letter_code), one bytes object per word
+    word_codes = [word.encode("ascii").translate(LETTER_CODES) for word in words]
+    word_histograms = [letter_histogram(codes) for codes in word_codes]
+    word_bonuses = [
+        LONG_WORD_BONUS_POINTS if len(codes) > LONG_WORD_MINIMUM_LETTER_COUNT else 0
+        for codes in word_codes
+    ]
+
+    # Build the DAWG straight from the sorted words: each word shares the
+    # prefix it has with the word before it, and the nodes past that prefix
+    # can no longer change, so they are merged with an equal registered node
+    # (same end of word flag, same children) or registered themselves
+    # node 0 is the root, the node of the empty prefix
+    children, terminal, suffix_values = [{}], bytearray(1), [0]
+    root = 0
+    register = {}
+    free_nodes = []
+    # (parent, letter, child) edges along the last word not yet minimized
+    unchecked = []
+
+    def minimize(depth):
+        while len(unchecked) > depth:
+            parent, letter, child = unchecked.pop()
+            edges = children[child]
+            signature = (terminal[child], tuple(edges.items()))
+            node_id = register.get(signature)
+            if node_id is None:
+                register[signature] = child
+                suffix_values[child] = max(
+                    (
+                        LETTERS_AND_VALUES[character] + suffix_values[next_node]
+                        for character, next_node in edges.items()
+                    ),
+                    default=0,
+                )
+            else:
+                children[parent][letter] = node_id
+                free_nodes.append(child)
+
+    previous_word = ""
+    for word in sorted(words_set):
+        common_length = 0
+        for character, previous_character in zip(word, previous_word):
+            if character != previous_character:
+                break
+            common_length += 1
+        minimize(common_length)
+
+        node = unchecked[-1][2] if unchecked else root
+        for letter in word[common_length:]:
+            if free_nodes:
+                child = free_nodes.pop()
+                children[child] = {}
+                terminal[child] = False
+            else:
+                child = len(children)
+                children.append({})
+                terminal.append(False)
+                suffix_values.append(0)
+            children[node][letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        terminal[node] = True
+        previous_word = word
+    minimize(0)
+    suffix_values[root] = max(
+        (
+            LETTERS_AND_VALUES[character] + suffix_values[child]
+            for character, child in children[root].items()
+        ),
+        default=0,
+    )
+    # the same DAWG as flat tables: child_table[node * 27 + code] is the child
+    # for a letter code or 0 (the root is nobody's child), and edges lists
+    # (code, child) pairs in letter order
+    child_table = array("i", bytes(4 * 27 * len(children)))
+    edges = []
+    for node, node_children in enumerate(children):
+        node_edges = tuple((letter_code(letter), child) for letter, child in node_children.items())
+        for code, child in node_edges:
+            child_table[node * 27 + code] = child
+        edges.append(node_edges)
+    return Dictionary(
+        words_set,
+        words,
+        word_codes,
+        word_histograms,
+        word_bonuses,
+        children,
+        terminal,
+        suffix_values,
+        root,
+        child_table,
+        edges,
+    )
+
 
 class WordBoard:
     """
@@ -78,73 +298,159 @@ class WordBoard:
 
     Attributes:
         words_set (set): A set of words loaded from the "words.txt" file.
-        letter_multipliers (defaultdict): A dictionary containing letter multipliers.
-        word_multipliers (defaultdict): A dictionary containing word multipliers.
+        words (list): The words of words_set in descending order.
+        word_codes (list): The letter codes of each word in words, as bytes.
+        word_histograms (list): The packed letter histogram of each word in words.
+        word_bonuses (list): The long word bonus of each word in words.
+        letter_multipliers (bytearray): The letter multiplier of each flat cell id (default 1).
+        word_multipliers (bytearray): The word multiplier of each flat cell id (default 1).
         board (list): A 2D list representing the game board.
+        board_bytes (bytes): The board flattened row by row into letter codes.
+        board_histogram (int): The packed letter histogram of board_bytes.
         row_count (int): Number of rows on the board.
         column_count (int): Number of columns on the board.
-        total_count (Counter): Count of each letter available on the board.
-        word_values (list): A list of tuples containing word values and words.
-        skips (int): Number of letters that can be skipped in forming a word.
+        neighbors (list): For each flat cell id, the flat ids of its adjacent cells.
+        neighbor_bits (list): For each flat cell id, (flat id, 1 << flat id) of its adjacent cells.
+        neighbor_bits_by_code (list): neighbor_bits of each flat cell id, split into one list per
+            letter code of the adjacent cell.
+        cells (list): The (row, column) of each flat cell id.
+        reachable_indices (list): The indices into words of the words the board has
+            enough letters for, without skips. Built on first access.
+        word_values (list): A list of tuples containing word values and the reachable words.
+            Built on first access; the searches do not need it.
+        children (list): For each DAWG node, a dict mapping letters to child node ids.
+        terminal (bytearray): For each DAWG node, 1 if a word ends there.
+        suffix_values (list): For each DAWG node, the highest sum of letter values of any
+            word ending that can follow it.
+        root (int): The id of the DAWG node for the empty prefix.
+        child_table (array): The DAWG's child of node for letter code at node * 27 + code,
+            or 0 if there is none.
+        edges (list): For each DAWG node, its (letter code, child node id) pairs in letter order.
     """
 
     def __init__(self):
         """
         Initializes a WordBoard instance.
 
-        Reads words from a file and initializes various attributes needed for
-        managing the game board.
+        Loads the shared word list (see load_dictionary) and initializes various
+        attributes needed for managing the game board.
         """
-        self.words_set = set()
-        self.letter_multipliers = defaultdict(lambda: 1)
-        self.word_multipliers = defaultdict(lambda: 1)
+        self.letter_multipliers = bytearray()
+        self.word_multipliers = bytearray()
         self.board = []
+        self.board_bytes = b""
+        self.board_histogram = 0
         self.row_count = 0
         self.column_count = 0
-        self.total_count = Counter()
-        self.word_values = []
-        self.skips = 0
-
-        with open("words.txt", encoding="utf-8") as file:
-            self.words_set = {word[:-1] for word in file.readlines()}
+        self.neighbors = []
+        self.neighbor_bits = []
+        self.neighbor_bits_by_code = []
+        self.cells = []
+        # back reachable_indices and word_values; None means rebuild on next access
+        self._reachable_indices = []
+        self._word_values = []
+        # the letter values word_values is ranked by, set by recalculate
+        self._letter_values = LETTER_VALUES
+        # letter values -> word_values for the current board, least recently used first
+        self._rankings = OrderedDict()
+        # (word, skips) -> board_contains result and (skips, start cells) ->
+        # best_word result, both valid until the next recalculate
+        self._contains_cache = {}
+        self._best_word_cache = {}
+
+        # built once per process and shared by every WordBoard
+        dictionary = load_dictionary()
+        self.words_set = dictionary.words_set
+        self.words = dictionary.words
+        self.word_codes = dictionary.word_codes
+        self.word_histograms = dictionary.word_histograms
+        self.word_bonuses = dictionary.word_bonuses
+        self.children = dictionary.children
+        self.terminal = dictionary.terminal
+        self.suffix_values = dictionary.suffix_values
+        self.root = dictionary.root
+        self.child_table = dictionary.child_table
+        self.edges = dictionary.edges
 
     def recalculate(self):
         """
         Recalculate board-related attributes.
 
         This method recalculates letter values and board values based on the current state of the board.
+        word_values is ranked again only when it is next read.
+        Results cached by board_contains and best_word are dropped, as the board or its
+        multipliers changed.
         """
-        max_global_multiplier = max(self.word_multipliers.values(), default=1)
-        max_character_multiplier = defaultdict(lambda: 1)
-        board_row_count = 5
-        board_column_count = 5
-        for row, column in product(range(board_row_count), range(board_column_count)):
-            max_character_multiplier[self.board[row][column]] = max(
-                max_character_multiplier[self.board[row][column]],
-                max_global_multiplier,
-                self.letter_multipliers[(row, column)],
-            )
-
-        letter_values = {
-            letter: val * max_character_multiplier[letter]
-            for letter, val in LETTERS_AND_VALUES.items()
-        }
-
-        long_word_bonus_points = 10
-        long_word_minimum_letter_count = 6
-
-        def calculate_value(word):
-            value = sum(
-                letter_values[character.lower()]
-                for character in word
-                if character.lower() in LETTERS_AND_VALUES
-            ) + (
-                        long_word_bonus_points if len(word) > long_word_minimum_letter_count else 0
-                    )
-            return value
+        self._contains_cache.clear()
+        self._best_word_cache.clear()
+        max_global_multiplier = max(self.word_multipliers, default=1)
+        # indexed by letter code; code 26 collects cells that hold no letter.
+        # Every letter on the board may get the biggest word multiplier, and
+        # only cells with a bigger letter multiplier can raise that
+        max_character_multiplier = [1] * 27
+        for code, multiplier in zip(self.board_bytes, self.letter_multipliers):
+            if multiplier < max_global_multiplier:
+                multiplier = max_global_multiplier
+            if multiplier > max_character_multiplier[code]:
+                max_character_multiplier[code] = multiplier
+
+        self._letter_values = tuple(
+            value * max_character_multiplier[code] for code, value in enumerate(LETTER_VALUES)
+        )
+        self._word_values = None
+
+    @property
+    def reachable_indices(self):
+        """
+        list: The indices into words of the words the board has enough letters for, without skips.
+        """
+        if self._reachable_indices is None:
+            self._reachable_indices = [
+                index
+                for index, histogram in enumerate(self.word_histograms)
+                if histogram_fits(histogram, self.board_histogram)
+            ]
+        return self._reachable_indices
+
+    @property
+    def word_values(self):
+        """
+        list: (value, word) pairs of the reachable words, highest value first.
 
-        self.word_values = [(calculate_value(word), word) for word in self.words_set]
-        self.word_values.sort(reverse=True)
+        The word rankings of the last few letter value layouts are kept, so toggling a
+        multiplier back and forth does not score and sort the words again.
+        """
+        if self._word_values is not None:
+            return self._word_values
+        # word multipliers are applied per path when searching, so the ranking
+        # only depends on the letter values
+        letter_values = self._letter_values
+        ranking = self._rankings.get(letter_values)
+        if ranking is not None:
+            self._rankings.move_to_end(letter_values)
+            self._word_values = ranking
+            return ranking
+
+        # every step below runs as a C-level map over the reachable words
+        reachable = self.reachable_indices
+        codes = map(self.word_codes.__getitem__, reachable)
+        if max(letter_values) < 256:
+            # translate every word's codes to letter values and sum the bytes
+            table = bytes(letter_values) + bytes(256 - len(letter_values))
+            values = map(sum, map(bytes.translate, codes, repeat(table)))
+        else:
+            values = (sum(map(letter_values.__getitem__, word_codes)) for word_codes in codes)
+        values = map(add, values, map(self.word_bonuses.__getitem__, reachable))
+
+        # words are stored in descending order, so this stable sort by value
+        # ranks ties the same way sorting (value, word) pairs in reverse would
+        ranking = sorted(
+            zip(values, map(self.words.__getitem__, reachable)), key=itemgetter(0), reverse=True
+        )
+        self._rankings[letter_values] = self._word_values = ranking
+        if len(self._rankings) > RANKING_CACHE_SIZE:
+            self._rankings.popitem(last=False)
+        return ranking
 
     def set_board(self, game_board):
         """
@@ -158,10 +464,42 @@ class WordBoard:
         self.board = game_board
         self.row_count = len(game_board)
         self.column_count = len(game_board[0])
-        self.total_count = Counter(cell for row in game_board for cell in row)
-
-        self.word_multipliers = defaultdict(lambda: 1)
-        self.letter_multipliers = defaultdict(lambda: 1)
+        self.board_bytes = bytes(letter_code(cell) for row in game_board for cell in row)
+        self.board_histogram = letter_histogram(self.board_bytes)
+        self._reachable_indices = None
+        # the reachable words changed, so every ranking must be rebuilt
+        self._rankings.clear()
+        # neighbors[cell] lists the flat ids (row * column_count + column) of
+        # every cell adjacent to the flat id cell
+        self.neighbors = [
+            [
+                (row + row_offset) * self.column_count + column + column_offset
+                for row_offset, column_offset in NEIGHBOR_OFFSETS
+                if 0 <= row + row_offset < self.row_count
+                and 0 <= column + column_offset < self.column_count
+            ]
+            for row in range(self.row_count)
+            for column in range(self.column_count)
+        ]
+        # the same, as (flat id, visited bit) pairs for the searches
+        self.neighbor_bits = [
+            [(next_cell, 1 << next_cell) for next_cell in cell_neighbors]
+            for cell_neighbors in self.neighbors
+        ]
+        # neighbor_bits[cell] split by the letter code of the neighbor, for
+        # searches that can no longer skip and so only follow matching letters
+        self.neighbor_bits_by_code = [[[] for _ in range(27)] for _ in self.neighbor_bits]
+        for cell, cell_neighbors in enumerate(self.neighbor_bits):
+            for next_cell, bit in cell_neighbors:
+                self.neighbor_bits_by_code[cell][self.board_bytes[next_cell]].append((next_cell, bit))
+        # flat cell id -> (row, column)
+        self.cells = [
+            (row, column) for row in range(self.row_count) for column in range(self.column_count)
+        ]
+
+        # flat cell id -> multiplier, 1 meaning no multiplier
+        self.word_multipliers = bytearray(b"\x01" * self.row_count * self.column_count)
+        self.letter_multipliers = bytearray(b"\x01" * self.row_count * self.column_count)
         self.recalculate()
 
     def precheck(self, word):
@@ -176,123 +514,234 @@ class WordBoard:
 
         Checks if the required letters for the word are available on the board.
         """
-        word_count = Counter(word)
-        for character in word_count:
-            if word_count[character] > self.total_count[character]:
-                return False
-        return True
+        codes = word.encode("ascii", "replace").translate(LETTER_CODES)
+        # code 26 also counts the empty cells, which no character can match
+        if 26 in codes:
+            return False
+        return histogram_fits(letter_histogram(codes), self.board_histogram)
 
     def board_contains(self, word, skips=0):
         """
         Check if the board contains a given word.
 
         Args:
-            word (str): The word to check for.
+            word (str): The word to check for. A word with characters outside a-z is never
+                found, as none of them can be scored.
             skips (int, optional): The number of letters that can be skipped. Default is 0.
 
         Returns:
             tuple: A tuple containing the path of letters forming the word, its value, and skipped letters.
 
         Checks if the board contains the specified word considering skips and multipliers.
+        Results are cached per word and skip count until the board or a multiplier changes,
+        so repeated lookups do not search the board again.
         """
-        row_count, column_count = self.row_count, self.column_count
+        cached = self._contains_cache.get((word, skips))
+        if cached is not None:
+            return cached
+        # cells and letters are compared as letter codes, bytes against bytes
+        word_codes = word.encode("ascii", "replace").translate(LETTER_CODES)
+        # a character outside a-z shares code 26 with the empty cells, so it
+        # must not be compared with the board at all
+        if 26 in word_codes:
+            return [], 0, []
         if not skips and not self.precheck(word):
             return [], 0, []
 
-        def backtrack(starting_row, starting_column, remaining_letters):
-            if not remaining_letters:
-                return True
-            if self.board[starting_row][starting_column] != remaining_letters[0]:
-                if self.skips and self.board[starting_row][starting_column] != ".":
-                    self.skips -= 1
+        board_bytes, neighbor_bits, cells = self.board_bytes, self.neighbor_bits, self.cells
+        neighbor_bits_by_code = self.neighbor_bits_by_code
+        letter_multipliers, word_multipliers = self.letter_multipliers, self.word_multipliers
+
+        last_depth = len(word) - 1
+
+        # one code past the end, so the letter after the last one can be looked up
+        next_codes = word_codes + b"\x1a"
+
+        def candidates(cell, depth, skips_left):
+            # without skips left only neighbors holding the next letter can follow
+            if skips_left:
+                return iter(neighbor_bits[cell])
+            return iter(neighbor_bits_by_code[cell][next_codes[depth + 1]])
+
+        def backtrack(start_cell):
+            # Depth-first search with an explicit stack of frames rather than
+            # recursion: frame k holds the cell matched to letter k, whether it
+            # was skipped, the visited cells and skips left after it, and an
+            # iterator over the neighbors still to try from it
+            stack = [(start_cell, False, 1 << start_cell, skips, candidates(start_cell, 0, skips))]
+            while len(stack) <= last_depth:
+                _, _, visited, skips_left, pending = stack[-1]
+                next_code = word_codes[len(stack)]
+                for next_cell, bit in pending:
+                    if visited & bit:
+                        continue
+                    is_skip = board_bytes[next_cell] != next_code
+                    if is_skip and not skips_left:
+                        continue
+                    stack.append(
+                        (
+                            next_cell,
+                            is_skip,
+                            visited | bit,
+                            skips_left - is_skip,
+                            candidates(next_cell, len(stack), skips_left - is_skip),
+                        )
+                    )
+                    break
                 else:
-                    return False
-
-            temp, self.board[starting_row][starting_column] = self.board[starting_row][starting_column], "."
-            end_loop = False
-            if starting_row + 1 < row_count:
-                end_loop = end_loop or backtrack(starting_row + 1, starting_column, remaining_letters[1:])
-                if starting_column + 1 < column_count:
-                    end_loop = end_loop or backtrack(starting_row + 1, starting_column + 1, remaining_letters[1:])
-                if starting_column > 0:
-                    end_loop = end_loop or backtrack(starting_row + 1, starting_column - 1, remaining_letters[1:])
-            if starting_row > 0:
-                end_loop = end_loop or backtrack(starting_row - 1, starting_column, remaining_letters[1:])
-                if starting_column + 1 < column_count:
-                    end_loop = end_loop or backtrack(starting_row - 1, starting_column + 1, remaining_letters[1:])
-                if starting_column > 0:
-                    end_loop = end_loop or backtrack(starting_row - 1, starting_column - 1, remaining_letters[1:])
-            if starting_column + 1 < column_count:
-                end_loop = end_loop or backtrack(starting_row, starting_column + 1, remaining_letters[1:])
-            if starting_column > 0:
-                end_loop = end_loop or backtrack(starting_row, starting_column - 1, remaining_letters[1:])
-
-            self.board[starting_row][starting_column] = temp
-            if self.board[starting_row][starting_column] != remaining_letters[0]:
-                self.skips += 1
-
-            if end_loop:
-                path.append((starting_row, starting_column))
-                if self.board[starting_row][starting_column] != remaining_letters[0]:
-                    skipped.append((starting_row, starting_column))
-            return end_loop
+                    stack.pop()
+                    if not stack:
+                        return None
+
+            # the stack now spells the word; report it last letter first. Every
+            # code is below 26 here, so each has an entry in LETTER_VALUES
+            letter_value, word_multiplier = 0, 1
+            for depth, (cell, _, _, _, _) in enumerate(stack):
+                letter_value += letter_multipliers[cell] * LETTER_VALUES[word_codes[depth]]
+                word_multiplier *= word_multipliers[cell]
+            path = [cells[frame[0]] for frame in reversed(stack)]
+            skipped = [cells[frame[0]] for frame in reversed(stack) if frame[1]]
+            return path, letter_value * word_multiplier, skipped
 
         best = 0
         out = ([], 0, [])
-        for row in range(row_count):
-            for column in range(column_count):
-                self.skips = skips
-                path = []
-                skipped = []
-                if self.board[row][column] == word:
-                    value = (
-                            self.letter_multipliers[(row, column)]
-                            * self.word_multipliers[(row, column)]
-                            * LETTERS_AND_VALUES[word[0].lower()]
-                    )
-                    if value > best:
-                        out = ([(row, column)], value, [])
-                        best = value
-                if self.board[row][column] == word[0]:
-                    if backtrack(row, column, word):
-                        word_multiplier = reduce(
-                            lambda accumulator, current: accumulator * self.word_multipliers[current],
-                            path,
-                            1,
-                        )
-                        value = (
-                                sum(
-                                    self.letter_multipliers[cell]
-                                    * LETTERS_AND_VALUES[word[letter_index].lower()]
-                                    for letter_index, cell in enumerate(path[::-1])
-                                )
-                                * word_multiplier
-                        )
-                        if value > best:
-                            out = (path, value, skipped)
-                            best = value
+        board, first_code = self.board, word_codes[0]
+        for cell, (row, column) in enumerate(cells):
+            if board[row][column] == word:
+                value = letter_multipliers[cell] * word_multipliers[cell] * LETTER_VALUES[first_code]
+                if value > best:
+                    out = ([(row, column)], value, [])
+                    best = value
+            if board_bytes[cell] == first_code:
+                found = backtrack(cell)
+                if found is not None and found[1] > best:
+                    out = found
+                    best = found[1]
+        self._contains_cache[(word, skips)] = out
         return out
 
-    def best_word(self, skips=0):
+    def best_word(self, skips=0, start_cells=None):
         """
         Find the best word that can be formed on the board.
 
         Args:
             skips (int, optional): The number of letters that can be skipped. Default is 0.
+            start_cells (iterable, optional): The flat ids of the cells words may start from,
+                in the order they are tried. Default is every cell.
 
         Returns:
             tuple: A tuple containing the best word, its value, path, and skipped letters.
 
-        Finds the highest scoring word that can be formed on the board, considering skips and multipliers.
+        See best_words; a cached search with more skips answers this one as well.
+        """
+        if start_cells is not None:
+            start_cells = tuple(start_cells)
+        for (budget, budget_cells), results in self._best_word_cache.items():
+            if budget >= skips and budget_cells == start_cells:
+                return results[skips]
+        return self.best_words(skips, start_cells)[skips]
+
+    def best_words(self, skips=0, start_cells=None):
         """
-        current_best = ("", 0, [], [])
-        current_value = 0
-        for _, word in self.word_values:
-            path, actual_value, skipped = self.board_contains(word, skips)
-            if path and actual_value > current_value:
-                current_value = actual_value
-                current_best = (word, actual_value, path, skipped)
-        return current_best
+        Find the best word for every number of skipped letters up to a limit at once.
+
+        Args:
+            skips (int, optional): The largest number of letters that can be skipped. Default is 0.
+            start_cells (iterable, optional): The flat ids of the cells words may start from,
+                in the order they are tried. Default is every cell.
+
+        Returns:
+            tuple: For each skip count from 0 to skips, the result best_word gives for it.
+
+        Finds the highest scoring word for each skip count with one DAWG-guided search
+        over the board. A word's first letter is never skipped, and of words with equal
+        value the first one found wins. Results are cached until the board or a
+        multiplier changes.
+        """
+        if start_cells is not None:
+            start_cells = tuple(start_cells)
+        cached = self._best_word_cache.get((skips, start_cells))
+        if cached is not None:
+            return cached
+        row_count, column_count = self.row_count, self.column_count
+        board = self.board_bytes
+        cells, neighbor_bits = self.cells, self.neighbor_bits
+        # per cell, the multiplied value of every letter code
+        cell_values = [
+            [multiplier * value for value in LETTER_VALUES] for multiplier in self.letter_multipliers
+        ]
+        word_multipliers = self.word_multipliers
+        child_table, edges = self.child_table, self.edges
+        terminal, suffix_values = self.terminal, self.suffix_values
+        max_letter_multiplier = max(self.letter_multipliers, default=1)
+        # no path can collect a larger word multiplier than all of them together;
+        # a path may avoid any cell, so a multiplier below 1 cannot lower the bound
+        max_word_multiplier = 1
+        for multiplier in word_multipliers:
+            max_word_multiplier *= max(multiplier, 1)
+        # best[used] is the best word using at most `used` skips, so values never
+        # decrease along the list
+        best = [("", 0, [], [])] * (skips + 1)
+        letters = []
+        path = []
+        skipped = []
+
+        def visit(cell, code, node, visited, value, word_multiplier, skips_used):
+            value += cell_values[cell][code]
+            word_multiplier *= word_multipliers[cell]
+            if (value + suffix_values[node] * max_letter_multiplier) * max_word_multiplier <= best[
+                skips_used
+            ][1]:
+                # neither this prefix nor any of its endings can beat a best word
+                return
+            letters.append(code)
+            path.append(cell)
+            score = value * word_multiplier
+            if terminal[node] and score > best[skips_used][1]:
+                # paths are reported last letter first, like board_contains
+                found = (
+                    bytes(letters).translate(CODE_LETTERS).decode("ascii"),
+                    score,
+                    [cells[step] for step in reversed(path)],
+                    [cells[step] for step in reversed(skipped)],
+                )
+                for used in range(skips_used, skips + 1):
+                    if score > best[used][1]:
+                        best[used] = found
+            row = node * 27
+            # the next cell is entered inline rather than through another call
+            for next_cell, bit in neighbor_bits[cell]:
+                if visited & bit:
+                    continue
+                next_code = board[next_cell]
+                child = child_table[row + next_code]
+                if child:
+                    visit(next_cell, next_code, child, visited | bit, value, word_multiplier, skips_used)
+                if skips_used < skips:
+                    skipped.append(next_cell)
+                    for edge_code, child in edges[node]:
+                        if edge_code != next_code:
+                            visit(
+                                next_cell,
+                                edge_code,
+                                child,
+                                visited | bit,
+                                value,
+                                word_multiplier,
+                                skips_used + 1,
+                            )
+                    skipped.pop()
+            letters.pop()
+            path.pop()
+
+        root = self.root
+        for cell in range(row_count * column_count) if start_cells is None else start_cells:
+            code = board[cell]
+            child = child_table[root * 27 + code]
+            if child:
+                visit(cell, code, child, 1 << cell, 0, 1, 0)
+        result = self._best_word_cache[(skips, start_cells)] = tuple(best)
+        return result
 
     def add_multiplier(self, row, column, multiplier, word):
         """
@@ -301,15 +750,22 @@ class WordBoard:
         Args:
             row (int): The row of the cell to which the multiplier is applied.
             column (int): The column of the cell to which the multiplier is applied.
-            multiplier (int): The multiplier value to be added.
+            multiplier (int): The multiplier value to be added, from 0 to MAXIMUM_MULTIPLIER.
             word (bool): True if the multiplier is for a word, False if it's for a letter.
 
+        Raises:
+            ValueError: If the multiplier is outside 0 to MAXIMUM_MULTIPLIER.
+
         Updates multipliers and recalculates attributes based on the new multiplier.
         """
+        if not 0 <= multiplier <= MAXIMUM_MULTIPLIER:
+            raise ValueError(
+                f"multiplier must be between 0 and {MAXIMUM_MULTIPLIER}, got {multiplier}"
+            )
         if word:
-            self.word_multipliers[(row, column)] = multiplier
+            self.word_multipliers[row * self.column_count + column] = multiplier
         else:
-            self.letter_multipliers[(row, column)] = multiplier
+            self.letter_multipliers[row * self.column_count + column] = multiplier
         self.recalculate()
 
     def remove_multiplier(self, row, column):
@@ -322,26 +778,67 @@ class WordBoard:
 
         Resets multipliers for the specified cell and recalculates attributes.
         """
-        self.word_multipliers[(row, column)] = 1
-        self.letter_multipliers[(row, column)] = 1
+        self.word_multipliers[row * self.column_count + column] = 1
+        self.letter_multipliers[row * self.column_count + column] = 1
         self.recalculate()
 
 
+# the WordBoard of this process, built on first use by solve_board
+_process_word_board = None
+
+
+def solve_board(board, skips, start_cells=None):
+    """
+    Find the best word for every skip count up to a limit, reusing this process's WordBoard.
+
+    Building a WordBoard loads the whole word list, so each worker process
+    builds one the first time it is handed a board and keeps it.
+
+    Args:
+        board (list): A 2D list representing the game board.
+        skips (int): The largest number of letters that can be skipped.
+        start_cells (iterable, optional): The flat ids of the cells words may start from.
+
+    Returns:
+        tuple: The result of WordBoard.best_words for the board.
+    """
+    global _process_word_board
+    if _process_word_board is None:
+        _process_word_board = WordBoard()
+    _process_word_board.set_board(board)
+    return _process_word_board.best_words(skips, start_cells)
+
+
 if __name__ == "__main__":
-    # Read board and create wordboard
+    # Read board, then search it, on a pool of processes if there is more than one CPU
     board = [[character.lower() for character in input()] for _ in range(5)]
-    word_board = WordBoard()
-    word_board.set_board(board)
-    def findBestWords():
-        # Find best words
-        best_word_with_no_swaps = word_board.best_word()  # no swaps
-        print("No swaps:\n", best_word_with_no_swaps)
-        best_word_with_one_swap = word_board.best_word(1)  # one swap
-        print("One swap:\n", best_word_with_one_swap)
-        best_word_with_two_swaps = word_board.best_word(2)  # two swaps
-        print("Two swaps:\n", best_word_with_two_swaps)
-    
-    threading.Thread(target=findBestWords).start()
+    labels = ("No swaps", "One swap", "Two swaps")
+    # the start cells are split into one contiguous block per worker, so the
+    # search is shared out rather than left to one process
+    cell_count = sum(len(row) for row in board)
+    worker_count = min(os.cpu_count() or 1, MAXIMUM_WORKERS)
+    block_size = -(-cell_count // worker_count)
+    blocks = [
+        range(start, min(start + block_size, cell_count))
+        for start in range(0, cell_count, block_size)
+    ]
+    # each block is searched once for every swap count
+    if len(blocks) == 1:
+        # a worker would only load the word list again, so search here
+        results = [solve_board(board, len(labels) - 1)]
+    else:
+        # loaded before the workers start, so forked workers share this copy
+        # instead of each building the DAWG again
+        load_dictionary()
+        with ProcessPoolExecutor(max_workers=len(blocks)) as executor:
+            parts = [
+                executor.submit(solve_board, board, len(labels) - 1, block) for block in blocks
+            ]
+            results = [part.result() for part in parts]
+    for skips, label in enumerate(labels):
+        # first maximum in block order, the word a single search would find
+        best_word = max((result[skips] for result in results), key=lambda result: result[1])
+        print(label + ":\n", best_word)
 
     #x, y = map(int, input().split())
-    #wgXY = word_board.generateWords(x=x, y=y)
\ No newline at end of file
+    #wgXY = word_board.generateWords(x=x, y=y)